@@ -1,24 +1,52 @@
+import os
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 
-# GitHub raw URL base - replace with your repo's raw path
+# CSVs shipped alongside app.py; always used when present
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+# GitHub raw URL base, only used as a fallback for files missing from data/
 base_url = "https://github.com/ShubhamGupta-GGN/TFC/raw/refs/heads/main/data/"
 
-# Load all datasets
-@st.cache_data
+# Dataset name -> (file, columns the dashboard reads)
+files = {
+    "supplier": ("supplier.csv", ["Supplier", "Round", "Delivery reliability (%)", "Rejection  (%)"]),
+    "product": ("product.csv", ["Product", "Round", "Forecast error (MAPE)", "OSA"]),
+    "customer": ("customer.csv", ["Customer", "Round", "Service level (pieces)"]),
+    "component": ("component.csv", ["Component", "Round", "Component availability (%)"]),
+    "warehouse": ("warehouse.csv", ["Warehouse", "Round", "Cube utilization (%)"]),
+    "bottling": ("bottling_line.csv", ["Bottling line", "Round", "Production plan adherence (%)"]),
+}
+
+id_columns = ["Supplier", "Product", "Customer", "Component", "Warehouse", "Bottling line"]
+
+# Prefer the bundled CSVs; only go over the network when they are missing
+def data_source(filename):
+    local_path = os.path.join(data_dir, filename)
+    if os.path.exists(local_path):
+        return local_path
+    return base_url + filename
+
+# Load all datasets once per process; the frames are shared across reruns,
+# so treat them as read-only
+@st.cache_resource
 def load_data():
-    return {
-        "finance": pd.read_csv(base_url + "finance_report.csv"),
-        "supplier": pd.read_csv(base_url + "supplier.csv"),
-        "product": pd.read_csv(base_url + "product.csv"),
-        "customer": pd.read_csv(base_url + "customer.csv"),
-        "component": pd.read_csv(base_url + "component.csv"),
-        "supplier_component": pd.read_csv(base_url + "supplier_component.csv"),
-        "warehouse": pd.read_csv(base_url + "warehouse.csv"),
-        "bottling": pd.read_csv(base_url + "bottling_line.csv"),
-        "mixers": pd.read_csv(base_url + "mixers.csv")
+    data = {
+        name: pd.read_csv(data_source(filename), usecols=usecols)
+        for name, (filename, usecols) in files.items()
     }
+    # Dictionary-encode the ID columns once so filters and color= grouping
+    # compare integer codes instead of strings
+    for df in data.values():
+        for col in id_columns:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        # The plotted KPIs are percentages/ratios, where float32 is plenty and
+        # halves the arrays Plotly ships to the browser
+        floats = df.select_dtypes("float64").columns
+        df[floats] = df[floats].astype("float32")
+    return data
 
 data = load_data()
 